@@ -2,22 +2,31 @@ import os
 import sys
 import time
 import logging
+import logging.handlers
+import queue
+import atexit
 import json
 import re
-from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
-from colorama import init, Fore, Style
-import tiktoken  # For accurate token counting
-from openai import OpenAI
+from colorama import Fore, Style
+import httpx
+from openai import OpenAI, DefaultHttpxClient
 
+# Importing swarm_middle_agent also initializes colorama for the whole program
 from swarm_middle_agent import (
     swarm_middle_agent_interface,
     # swarm_chat_interface  # Placeholder for future use
+    USE_COLOR,
+    colorize,
+    cprint,
+    describe_agent,
 )
 
-# Initialize colorama
-init(autoreset=True)
-
 # =============================================================================
 # Logging Configuration
 # =============================================================================
@@ -65,10 +74,22 @@ file_handler.setLevel(logging.INFO)
 file_formatter = logging.Formatter('%(asctime)s %(levelname)s:%(message)s')
 file_handler.setFormatter(file_formatter)
 
-# Configure the root logger to use both handlers
+# Both handlers run on a background listener thread, so threads making API calls
+# only enqueue records instead of blocking on console and file writes
+log_queue = queue.Queue(-1)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+# Pass only the message through the queue; the listener's handlers add the prefix
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = logging.handlers.QueueListener(
+    log_queue, console_handler, file_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Configure the root logger to use the queue handler
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[console_handler, file_handler],
+    handlers=[queue_handler],
 )
 
 # =============================================================================
@@ -80,7 +101,25 @@ if not api_key:
     logging.error("OpenAI API key not found in environment variable 'OPENAI_API_KEY'. Please set it and rerun.")
     sys.exit(1)
 
-client = OpenAI(api_key=api_key)
+# Retries are left to the client: it backs off exponentially with jitter, honours
+# Retry-After on rate limits and only retries transient (connection, 408/409/429/5xx) errors.
+# RETRY_LIMIT counts retries, so a failing request is attempted RETRY_LIMIT + 1 times.
+RETRY_LIMIT = 3
+# Per-attempt timeout in seconds. o1 requests can reason for minutes before replying,
+# so the read timeout is generous; connecting should never take long.
+REQUEST_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+# One client (and one HTTP/2 connection pool) is shared by every agent, so concurrent
+# requests are multiplexed over a single TLS connection instead of opening one each
+client = OpenAI(
+    api_key=api_key,
+    max_retries=RETRY_LIMIT,
+    timeout=REQUEST_TIMEOUT,
+    http_client=DefaultHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    ),
+)
 
 # =============================================================================
 # Constants & Configuration
@@ -89,43 +128,284 @@ client = OpenAI(api_key=api_key)
 MAX_TOTAL_TOKENS = 4096
 MAX_REFINEMENT_ATTEMPTS = 3
 MAX_CHAT_HISTORY_TOKENS = 4096
-RETRY_LIMIT = 3
-RETRY_BACKOFF_FACTOR = 2
+# Fraction of a token budget at which estimated counts are replaced by exact ones
+TOKEN_RECOUNT_THRESHOLD = 0.9
+# Reasoning model for discussion, verification, refinement and blending; critiques
+# only comment on a response, so they use a faster, cheaper model
+REASONING_MODEL = "o1-2024-12-17"  # Adjust your model name here
+CRITIQUE_MODEL = "gpt-4o-mini"
 AGENTS_CONFIG_FILE = 'agents.json'
-
-# Main multi-agent reasoning sessions are stored here
-REASONING_HISTORY_FILE = 'reasoning_history.json'
+# Set RESPONSE_CACHE_SIZE=0 in the environment to disable response caching (e.g. for debugging)
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", 512))
+MAX_AGENT_WORKERS = 8
+# Responses shorter than this (estimated tokens), or opening like a refusal, are
+# passed through unchanged instead of being verified and refined
+REVIEW_MIN_TOKENS = 40
+REFUSAL_PREFIXES = ("I cannot", "I can't", "I'm sorry", "I am sorry", "An error occurred")
+
+# Shared worker pool for running agent actions concurrently. The work is I/O-bound
+# (one API call per agent), so a small fixed pool is reused across steps and prompts.
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_AGENT_WORKERS, thread_name_prefix="agent")
+
+# Bytes read at a time when scanning a history file backwards from its end
+HISTORY_READ_BLOCK_SIZE = 64 * 1024
+# Splits a prompt into the keywords used to search the local history
+WORD_PATTERN = re.compile(r"\w+")
+
+# Main multi-agent reasoning sessions are stored here, one JSON record per line
+REASONING_HISTORY_FILE = 'reasoning_history.jsonl'
 # Swarm-based sessions are stored separately
-SWARM_HISTORY_FILE = 'swarm_reasoning_history.json'
+SWARM_HISTORY_FILE = 'swarm_reasoning_history.jsonl'
+
+@lru_cache(maxsize=None)
+def get_encoding():
+    """
+    Loads the token encoding on first use and shares it with all agents. Exact
+    counts are only needed on cold paths, so tiktoken is not imported (and its
+    BPE tables are not loaded) at startup.
+
+    Returns:
+        tiktoken.Encoding: The cl100k_base encoding.
+    """
+    try:
+        import tiktoken  # For accurate token counting
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logging.error(f"Error getting encoding: {e}")
+        raise
+
+def count_tokens(texts):
+    """
+    Counts the tokens of several strings with a single batched encoder call.
+
+    Args:
+        texts (list): The strings to count.
+
+    Returns:
+        list: Token counts, one per input string.
+    """
+    return [len(tokens) for tokens in get_encoding().encode_ordinary_batch(texts)]
+
+def estimate_tokens(text):
+    """
+    Estimates a token count at roughly four characters per token, which is far
+    cheaper than BPE encoding and close enough for history budgeting.
+
+    Args:
+        text (str): The text to estimate.
+
+    Returns:
+        int: The estimated token count.
+    """
+    return (len(text) + 3) >> 2
+
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+# Process-local LRU cache of API responses, keyed by a hash of (model, messages)
+response_cache = OrderedDict()
+response_cache_lock = threading.Lock()
+
+def get_response_cache_key(model, messages, stream=False):
+    """
+    Builds a cache key from the model name and the exact messages sent.
+
+    Args:
+        model (str): The model name.
+        messages (list): The messages sent to the API.
+        stream (bool): Whether the request is streamed (cached in a separate form).
+
+    Returns:
+        bytes: A 128-bit digest identifying the request.
+    """
+    # Payloads are always built in the same key order, so sorting keys is unnecessary
+    payload = json.dumps({"model": model, "messages": messages, "stream": stream})
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+def get_cached_response(key):
+    """
+    Looks up a cached response and marks it as recently used.
+
+    Args:
+        key (bytes): The cache key.
+
+    Returns:
+        The cached value, or None on a miss.
+    """
+    if RESPONSE_CACHE_SIZE <= 0:
+        return None
+    with response_cache_lock:
+        if key in response_cache:
+            response_cache.move_to_end(key)
+            return response_cache[key]
+    return None
+
+def store_cached_response(key, value):
+    """
+    Stores a response, evicting the least recently used entry when the cache is full.
+
+    Args:
+        key (bytes): The cache key.
+        value: The response to cache.
+    """
+    if RESPONSE_CACHE_SIZE <= 0:
+        return
+    with response_cache_lock:
+        response_cache[key] = value
+        if len(response_cache) > RESPONSE_CACHE_SIZE:
+            response_cache.popitem(last=False)
+
+def create_chat_completion(model, messages):
+    """
+    Wraps 'client.chat.completions.create' with an in-memory LRU cache so identical
+    requests are answered without another API round-trip.
+
+    Args:
+        model (str): The model name.
+        messages (list): The messages to send.
+
+    Returns:
+        tuple: (reply_text, usage). usage is None on a cache hit, since no tokens
+            were billed for it.
+    """
+    key = get_response_cache_key(model, messages)
+    cached = get_cached_response(key)
+    if cached is not None:
+        logging.info(f"Response cache hit for model '{model}' (no tokens used).")
+        return cached[0], None
+
+    response = client.chat.completions.create(model=model, messages=messages)
+    result = (response.choices[0].message.content.strip(), getattr(response, 'usage', None))
+    store_cached_response(key, result)
+    return result
+
+def stream_chat_completion(model, messages, color=Fore.WHITE):
+    """
+    Streams a chat completion to the console as it is generated, so output appears
+    at first-token latency instead of after the full generation. Shares the
+    response cache with 'create_chat_completion'; cache hits are printed at once.
+
+    Args:
+        model (str): The model name.
+        messages (list): The messages to send.
+        color (str): The color code from colorama used for the streamed text.
+
+    Returns:
+        tuple: (reply_text, usage). usage is None when the API returned none and
+            on a cache hit, since no tokens were billed for it.
+    """
+    key = get_response_cache_key(model, messages, stream=True)
+    cached = get_cached_response(key)
+    if cached is not None:
+        logging.info(f"Response cache hit for model '{model}' (no tokens used).")
+        cprint(color, cached[0])
+        return cached[0], None
+
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        stream=True,
+        stream_options={"include_usage": True}
+    )
+    parts = []
+    usage = None
+    prefix = color if USE_COLOR else ""
+    for chunk in stream:
+        # The final chunk carries usage details and no choices
+        if getattr(chunk, 'usage', None):
+            usage = chunk.usage
+        if chunk.choices:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                sys.stdout.write(prefix + delta)
+                sys.stdout.flush()
+    print(Style.RESET_ALL if USE_COLOR else "")
+
+    result = ("".join(parts).strip(), usage)
+    store_cached_response(key, result)
+    return result
+
+def log_usage(label, usage):
+    """
+    Logs the token usage reported for a completion as a single record. Formatting is
+    deferred to the logging handlers, and the record also lands in reasoning.log.
+
+    Args:
+        label (str): Who made the request (an agent name or 'Blending').
+        usage: The usage object returned by the API, or None (including for
+            response cache hits).
+
+    Returns:
+        int or None: Tokens in the visible reply (completion minus reasoning tokens),
+            or None when no usage details were returned.
+    """
+    if not usage:
+        logging.info("%s: no usage details returned (cached or not reported); no tokens counted.", label)
+        return None
+
+    prompt_tokens = getattr(usage, 'prompt_tokens', 0)
+    completion_tokens = getattr(usage, 'completion_tokens', 0)
+    total_tokens = getattr(usage, 'total_tokens', 0)
+
+    prompt_tokens_details = getattr(usage, 'prompt_tokens_details', None)
+    cached_tokens = getattr(prompt_tokens_details, 'cached_tokens', 0) if prompt_tokens_details else 0
+
+    completion_tokens_details = getattr(usage, 'completion_tokens_details', None)
+    reasoning_tokens = getattr(completion_tokens_details, 'reasoning_tokens', 0) if completion_tokens_details else 0
+
+    logging.info(
+        "%s used %d cached tokens out of %d prompt tokens; generated %d completion tokens, "
+        "including %d reasoning tokens. Total tokens used: %d.",
+        label, cached_tokens or 0, prompt_tokens, completion_tokens, reasoning_tokens or 0, total_tokens
+    )
+    return completion_tokens - (reasoning_tokens or 0)
 
 # =============================================================================
 # Utility Functions for Saving & Retrieving Reasoning History
 # =============================================================================
 
-def append_session_record(file_path: str, record: dict):
+def migrate_legacy_history(file_path: str):
     """
-    Appends a single session record to a specified JSON file. Each file is treated as
-    a list of session records. Uses ensure_ascii=False to preserve Unicode characters.
+    Converts a history file from the earlier JSON-list format (same name without
+    the trailing 'l') into the JSON Lines file, if the new file does not exist yet.
+    The old file is left in place.
 
     Args:
-        file_path (str): Path to the JSON file.
-        record (dict): The session record to append.
+        file_path (str): Path to the JSON Lines file.
     """
-    if not os.path.exists(file_path):
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump([], f, indent=2, ensure_ascii=False)
+    legacy_path = file_path[:-1] if file_path.endswith('.jsonl') else None
+    if not legacy_path or os.path.exists(file_path) or not os.path.exists(legacy_path):
+        return
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(legacy_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            if not isinstance(data, list):
-                data = []
-    except (json.JSONDecodeError, FileNotFoundError):
-        data = []
+    except (json.JSONDecodeError, OSError) as e:
+        logging.error(f"Could not migrate '{legacy_path}': {e}")
+        return
+    if not isinstance(data, list):
+        return
 
-    data.append(record)
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in data)
+    logging.info(f"Migrated {len(data)} records from '{legacy_path}' to '{file_path}'.")
+
+def append_session_record(file_path: str, record: dict):
+    """
+    Appends a single session record to a specified JSON Lines file. Each record is
+    written as one line, so appending never reads or rewrites earlier sessions.
+    Uses ensure_ascii=False to preserve Unicode characters.
+
+    Args:
+        file_path (str): Path to the JSON Lines file.
+        record (dict): The session record to append.
+    """
+    with open(file_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    # Context looked up before this record was written is now stale
+    get_local_context_for_prompt.cache_clear()
 
 def append_reasoning_history(record: dict):
     """Appends a reasoning session record."""
@@ -135,52 +415,98 @@ def append_swarm_history(record: dict):
     """Appends a swarm-based reasoning session record."""
     append_session_record(SWARM_HISTORY_FILE, record)
 
-def load_reasoning_history_for_context(max_records=5, search_keywords=None):
+def get_keyword_pattern(keywords):
     """
-    Loads the last 'max_records' from 'reasoning_history.json', optionally
-    searching for records that contain 'search_keywords'.
-    Returns a list of summarized context strings.
+    Compiles a pattern matching any of the keywords as a substring.
+
+    Args:
+        keywords (list): Lowercased, deduplicated keywords.
+
+    Returns:
+        re.Pattern: The compiled alternation.
+    """
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+def read_lines_reversed(file_path, block_size=HISTORY_READ_BLOCK_SIZE):
+    """
+    Yields the lines of a file from last to first, reading fixed-size blocks
+    backwards from the end, so a caller that stops early never loads the whole file.
 
     Args:
+        file_path (str): Path to the file.
+        block_size (int): Number of bytes read per block.
+
+    Yields:
+        str: Each line, newest first, decoded as UTF-8.
+    """
+    with open(file_path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            # A newline byte never occurs inside a multi-byte UTF-8 character,
+            # so splitting the raw bytes on b"\n" is safe
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may continue in the previous block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode('utf-8', errors='replace')
+        yield remainder.decode('utf-8', errors='replace')
+
+def load_history_for_context(file_path, max_records=5, search_keywords=None):
+    """
+    Loads the last 'max_records' from a JSON Lines history file, optionally
+    searching for records that contain 'search_keywords'. Lines are parsed
+    newest first and only until enough records have been found.
+
+    Args:
+        file_path (str): Path to the JSON Lines file.
         max_records (int): Maximum number of records to retrieve.
-        search_keywords (list, optional): Keywords to filter records.
+        search_keywords (list, optional): Lowercased, deduplicated keywords to
+            filter records, as produced by 'get_local_context_for_prompt'.
 
     Returns:
         list: Summarized context strings.
     """
     contexts = []
-    try:
-        with open(REASONING_HISTORY_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, list):
-                return contexts
-    except (json.JSONDecodeError, FileNotFoundError):
+    if not os.path.exists(file_path):
         return contexts
 
-    # Reverse to start with the newest records
-    data.reverse()
-    count = 0
-    for entry in data:
-        if count >= max_records:
+    keyword_pattern = None
+    if search_keywords:
+        # One pattern scans each record for all keywords in a single pass
+        keyword_pattern = get_keyword_pattern(search_keywords)
+
+    # Start with the newest records; only the tail of the file is read
+    for line in read_lines_reversed(file_path):
+        if len(contexts) >= max_records:
             break
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # Skip blank or partially written lines
+            continue
         # If keywords are provided, perform a naive search
-        if search_keywords:
+        if keyword_pattern:
             combined_text = (entry.get("user_prompt", "") + " " +
                              entry.get("final_response", "")).lower()
-            if not any(kw.lower() in combined_text for kw in search_keywords):
+            if not keyword_pattern.search(combined_text):
                 continue
         # Summarize the record
         summary = (f"Timestamp: {entry.get('timestamp')}\n"
                    f"User Prompt: {entry.get('user_prompt')}\n"
                    f"Final Response: {entry.get('final_response')}")
         contexts.append(summary)
-        count += 1
 
     return contexts
 
-def load_swarm_history_for_context(max_records=5, search_keywords=None):
+def load_reasoning_history_for_context(max_records=5, search_keywords=None):
     """
-    Similar to 'load_reasoning_history_for_context' but for swarm-based history.
+    Loads the last 'max_records' from 'reasoning_history.jsonl', optionally
+    searching for records that contain 'search_keywords'.
+    Returns a list of summarized context strings.
 
     Args:
         max_records (int): Maximum number of records to retrieve.
@@ -189,38 +515,28 @@ def load_swarm_history_for_context(max_records=5, search_keywords=None):
     Returns:
         list: Summarized context strings.
     """
-    contexts = []
-    try:
-        with open(SWARM_HISTORY_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, list):
-                return contexts
-    except (json.JSONDecodeError, FileNotFoundError):
-        return contexts
+    return load_history_for_context(REASONING_HISTORY_FILE, max_records, search_keywords)
 
-    data.reverse()
-    count = 0
-    for entry in data:
-        if count >= max_records:
-            break
-        if search_keywords:
-            combined_text = (entry.get("user_prompt", "") + " " +
-                             entry.get("final_response", "")).lower()
-            if not any(kw.lower() in combined_text for kw in search_keywords):
-                continue
-        summary = (f"Timestamp: {entry.get('timestamp')}\n"
-                   f"User Prompt: {entry.get('user_prompt')}\n"
-                   f"Final Response: {entry.get('final_response')}")
-        contexts.append(summary)
-        count += 1
+def load_swarm_history_for_context(max_records=5, search_keywords=None):
+    """
+    Similar to 'load_reasoning_history_for_context' but for swarm-based history.
 
-    return contexts
+    Args:
+        max_records (int): Maximum number of records to retrieve.
+        search_keywords (list, optional): Keywords to filter records.
+
+    Returns:
+        list: Summarized context strings.
+    """
+    return load_history_for_context(SWARM_HISTORY_FILE, max_records, search_keywords)
 
+@lru_cache(maxsize=64)
 def get_local_context_for_prompt(user_prompt, is_swarm=False, max_records=3):
     """
-    Fetches local 'memory' from either reasoning_history.json or swarm_reasoning_history.json,
+    Fetches local 'memory' from either reasoning_history.jsonl or swarm_reasoning_history.jsonl,
     using naive keyword search on user_prompt. Returns a compiled context string to pass
-    to the agent's instructions or prompt.
+    to the agent's instructions or prompt. Results are cached until the next session
+    record is appended.
 
     Args:
         user_prompt (str): The user's input prompt.
@@ -230,8 +546,8 @@ def get_local_context_for_prompt(user_prompt, is_swarm=False, max_records=3):
     Returns:
         str: Combined context string or empty string if no context found.
     """
-    # Extract simple keywords from user_prompt
-    keywords = re.findall(r"\w+", user_prompt)
+    # Extract simple keywords from user_prompt, lowercased and without repeats
+    keywords = list(dict.fromkeys(WORD_PATTERN.findall(user_prompt.lower())))
 
     if is_swarm:
         found_contexts = load_swarm_history_for_context(
@@ -256,9 +572,11 @@ def get_local_context_for_prompt(user_prompt, is_swarm=False, max_records=3):
 # Agent Configuration
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def load_agents_config():
     """
-    Loads agent configurations from the 'agents.json' file.
+    Loads agent configurations from the 'agents.json' file. The file is parsed once
+    per process; call 'load_agents_config.cache_clear()' to pick up edits.
 
     Returns:
         list: A list of agent configurations.
@@ -266,25 +584,20 @@ def load_agents_config():
     try:
         with open(AGENTS_CONFIG_FILE, 'r', encoding='utf-8') as f:
             agents_data = json.load(f)
-        print(Fore.YELLOW + f"Successfully loaded agents configuration from '{AGENTS_CONFIG_FILE}'." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Successfully loaded agents configuration from '{AGENTS_CONFIG_FILE}'.")
         return agents_data.get('agents', [])
     except FileNotFoundError:
-        print(Fore.YELLOW + f"Agents configuration file '{AGENTS_CONFIG_FILE}' not found." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Agents configuration file '{AGENTS_CONFIG_FILE}' not found.")
         logging.error(f"Agents configuration file '{AGENTS_CONFIG_FILE}' not found.")
         return []
     except json.JSONDecodeError as e:
-        print(Fore.YELLOW + f"Error parsing '{AGENTS_CONFIG_FILE}': {e}" + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Error parsing '{AGENTS_CONFIG_FILE}': {e}")
         logging.error(f"Error parsing '{AGENTS_CONFIG_FILE}': {e}")
         return []
 
-def get_shared_system_message():
-    """
-    Provides a shared system message for all agents to optimize prompt caching.
-
-    Returns:
-        str: The shared system message.
-    """
-    system_message = """
+# Shared system message for all agents. Kept as a module-level constant so every
+# agent's prompt starts with the same bytes, which lets prompt caching match it.
+SHARED_SYSTEM_MESSAGE = """
 Your name is AI Assistant. You are a highly knowledgeable AI language model developed
 to assist users with a wide range of tasks, including answering questions, providing
 explanations, and offering insights across various domains.
@@ -312,7 +625,15 @@ Guidelines for Interaction:
 
 This system message is consistent across all agents to optimize prompt caching.
     """
-    return system_message
+
+def get_shared_system_message():
+    """
+    Provides a shared system message for all agents to optimize prompt caching.
+
+    Returns:
+        str: The shared system message.
+    """
+    return SHARED_SYSTEM_MESSAGE
 
 # =============================================================================
 # Agent Class Definition
@@ -329,27 +650,77 @@ class Agent:
         'critique': "critiquing another agent's response"
     }
 
+    # Task instructions stay identical across calls and precede the volatile content,
+    # so repeated verify/refine/critique requests share the longest possible prefix
+    # for the provider's automatic prompt caching.
+    TASK_INSTRUCTIONS = {
+        'verify':    "Verify the accuracy of the following information:",
+        'refine':    "Please refine the following response to improve its accuracy and completeness:",
+        'more_time': "Take additional time to improve the response thoroughly.",
+        'passes':    "Perform {iterations} successive refinement passes, each improving on the previous one, and return only the final refined response.",
+        'critique':  "Critique the following response for accuracy and completeness:",
+    }
+
     def __init__(self, color, **kwargs):
         self.name = kwargs.get('name', 'AI Assistant')
         self.color = color
-        self.messages = []
-        self.chat_history = []
+        self.messages = deque()
+        self.chat_history = deque()
+        self._total_tokens = 0
+        self._chat_total_tokens = 0
+        self._system_message = None
+        self._system_msg_dict = None
         self.system_purpose = kwargs.get('system_purpose', '')
+        # Bound action methods, resolved once instead of on every dispatch
+        self._dispatch = {
+            'discuss':  self.discuss,
+            'verify':   self.verify,
+            'refine':   self.refine,
+            'critique': self.critique,
+        }
 
         additional_attributes = {
             k: v
             for k, v in kwargs.items()
             if k not in ['name', 'system_purpose', 'color']
         }
-        self.instructions = self.system_purpose
+        # Collect every section first and join once instead of growing the string
+        sections = [self.system_purpose]
         for attr_name, attr_value in additional_attributes.items():
+            title = attr_name.replace('_', ' ').title()
             if isinstance(attr_value, dict):
-                details = "\n".join(f"{kk.replace('_', ' ').title()}: {vv}" for kk, vv in attr_value.items())
-                self.instructions += f"\n\n{attr_name.replace('_', ' ').title()}:\n{details}"
+                details = "\n".join([f"{kk.replace('_', ' ').title()}: {vv}" for kk, vv in attr_value.items()])
+                sections.append(f"{title}:\n{details}")
             else:
-                self.instructions += f"\n\n{attr_name.replace('_', ' ').title()}: {attr_value}"
+                sections.append(f"{title}: {attr_value}")
+        self.instructions = "\n\n".join(sections)
 
-    def _add_message(self, role, content, mode='reasoning'):
+    def get_system_message(self):
+        """
+        Returns the shared system message followed by the agent's instructions.
+        Built once on first use (after initialize_agents has finished adding peer
+        information) so every request starts with a byte-identical prefix.
+
+        Returns:
+            str: The agent's full system message.
+        """
+        if self._system_message is None:
+            self._system_message = f"{SHARED_SYSTEM_MESSAGE}\n\n{self.instructions}"
+        return self._system_message
+
+    def get_system_message_dict(self):
+        """
+        Returns the system message wrapped as a chat message. The dict is created
+        once and reused at the head of every request; it is never mutated.
+
+        Returns:
+            dict: The system message in chat message format.
+        """
+        if self._system_msg_dict is None:
+            self._system_msg_dict = {"role": "user", "content": self.get_system_message()}
+        return self._system_msg_dict
+
+    def _add_message(self, role, content, mode='reasoning', token_hint=None):
         """
         Adds a message to the agent's message history and manages token limits.
 
@@ -357,96 +728,110 @@ class Agent:
             role (str): The role of the message sender ('user', 'assistant').
             content (str): The message content.
             mode (str): The mode of operation ('reasoning' or 'chat').
+            token_hint (int, optional): Token count reported by the API for this
+                content; when given, the content is not re-encoded locally.
         """
-        try:
-            encoding = tiktoken.get_encoding("cl100k_base")
-        except Exception as e:
-            logging.error(f"Error getting encoding: {e}")
-            raise e
-
+        # Each message keeps its own token count so the running totals never
+        # require re-encoding the whole history. Without an API count, a cheap
+        # estimate is stored and only made exact when the budget gets close.
+        if token_hint:
+            tokens, exact = token_hint, True
+        else:
+            tokens, exact = estimate_tokens(content), False
+        message = {"role": role, "content": content, "tokens": tokens, "exact": exact}
         if mode == 'chat':
-            self.chat_history.append({"role": role, "content": content})
-            total_tokens = sum(len(encoding.encode(msg['content'])) for msg in self.chat_history)
-            while total_tokens > MAX_CHAT_HISTORY_TOKENS and len(self.chat_history) > 1:
-                self.chat_history.pop(0)
-                total_tokens = sum(len(encoding.encode(msg['content'])) for msg in self.chat_history)
+            self.chat_history.append(message)
+            self._chat_total_tokens = self._trim_history(
+                self.chat_history, self._chat_total_tokens + tokens, MAX_CHAT_HISTORY_TOKENS
+            )
         else:
-            self.messages.append({"role": role, "content": content})
-            total_tokens = sum(len(encoding.encode(msg['content'])) for msg in self.messages)
-            while total_tokens > MAX_TOTAL_TOKENS and len(self.messages) > 1:
-                self.messages.pop(0)
-                total_tokens = sum(len(encoding.encode(msg['content'])) for msg in self.messages)
+            self.messages.append(message)
+            self._total_tokens = self._trim_history(
+                self.messages, self._total_tokens + tokens, MAX_TOTAL_TOKENS
+            )
 
-    def _handle_reasoning_logic(self, prompt):
+    @staticmethod
+    def _trim_history(history, total_tokens, max_tokens):
+        """
+        Drops the oldest messages until the history fits the token budget, always
+        keeping the newest message. Estimated counts are replaced by exact ones
+        (one batched encoder call) once the total nears the budget, then the
+        oldest messages are popped from the front of the deque in O(1) each.
+
+        Args:
+            history (deque): The message history to trim in place.
+            total_tokens (int): The current token total of the history.
+            max_tokens (int): The token budget.
+
+        Returns:
+            int: The token total after trimming.
+        """
+        if total_tokens > max_tokens * TOKEN_RECOUNT_THRESHOLD:
+            estimated = [msg for msg in history if not msg["exact"]]
+            if estimated:
+                for msg, tokens in zip(estimated, count_tokens([msg["content"] for msg in estimated])):
+                    msg["tokens"] = tokens
+                    msg["exact"] = True
+                total_tokens = sum(msg["tokens"] for msg in history)
+
+        while total_tokens > max_tokens and len(history) > 1:
+            total_tokens -= history.popleft()["tokens"]
+        return total_tokens
+
+    def clear_history(self, mode=None):
+        """
+        Clears the agent's message history and resets the running token totals.
+
+        Args:
+            mode (str, optional): 'reasoning' or 'chat' to clear only one history;
+                clears both when omitted.
+        """
+        if mode in (None, 'reasoning'):
+            self.messages.clear()
+            self._total_tokens = 0
+        if mode in (None, 'chat'):
+            self.chat_history.clear()
+            self._chat_total_tokens = 0
+
+    def _handle_reasoning_logic(self, prompt, stateless=False, model=REASONING_MODEL):
         """
         Handles generating a response from the OpenAI API in non-chat mode.
 
         Args:
             prompt (str): The prompt to send to the API.
+            stateless (bool): Send only the system message and the prompt, without
+                the agent's history, and leave the history unchanged.
+            model (str): The model to use for this request.
 
         Returns:
             tuple: (assistant_reply, duration)
         """
-        shared_system = get_shared_system_message()
-        system_message = f"{shared_system}\n\n{self.instructions}"
-
-        messages = [{"role": "user", "content": system_message}]
-        messages.extend(self.messages)
+        messages = [self.get_system_message_dict()]
+        if not stateless:
+            messages.extend({"role": m["role"], "content": m["content"]} for m in self.messages)
         messages.append({"role": "user", "content": prompt})
 
-        start_time = time.time()
-        retries = 0
-        backoff = 1
-
-        while retries < RETRY_LIMIT:
-            try:
-                response = client.chat.completions.create(
-                    model="o1-2024-12-17",  # Adjust your model name here
-                    messages=messages
-                )
-                end_time = time.time()
-                duration = end_time - start_time
-
-                assistant_reply = response.choices[0].message.content.strip()
-                self._add_message("assistant", assistant_reply)
-
-                usage = getattr(response, 'usage', None)
-                if usage:
-                    # Use safe getattr calls to avoid .get
-                    prompt_tokens = getattr(usage, 'prompt_tokens', 0)
-                    completion_tokens = getattr(usage, 'completion_tokens', 0)
-                    total_tokens = getattr(usage, 'total_tokens', 0)
-
-                    prompt_tokens_details = getattr(usage, 'prompt_tokens_details', None)
-                    if prompt_tokens_details:
-                        cached_tokens = getattr(prompt_tokens_details, 'cached_tokens', 0)
-                    else:
-                        cached_tokens = 0
-
-                    completion_tokens_details = getattr(usage, 'completion_tokens_details', None)
-                    if completion_tokens_details:
-                        reasoning_tokens = getattr(completion_tokens_details, 'reasoning_tokens', 0)
-                    else:
-                        reasoning_tokens = 0
-
-                    print(self.color + f"{self.name} used {cached_tokens} cached tokens out of {prompt_tokens} prompt tokens." + Style.RESET_ALL)
-                    print(self.color + f"{self.name} generated {completion_tokens} completion tokens, including {reasoning_tokens} reasoning tokens. Total tokens used: {total_tokens}." + Style.RESET_ALL)
-                else:
-                    print(self.color + f"{self.name} (No usage details returned.)" + Style.RESET_ALL)
-
-                return assistant_reply, duration
-            except Exception as e:
-                error_type = type(e).__name__
-                logging.error(f"Error in agent '{self.name}' reasoning: {error_type}: {e}")
-                retries += 1
-                if retries >= RETRY_LIMIT:
-                    logging.error(f"Agent '{self.name}' reached maximum retry limit.")
-                    break
-                backoff_time = backoff * (RETRY_BACKOFF_FACTOR ** (retries - 1))
-                logging.info(f"Retrying in {backoff_time} seconds...")
-                time.sleep(backoff_time)
+        start_time = time.perf_counter()
+        try:
+            assistant_reply, usage = create_chat_completion(
+                model=model,
+                messages=messages
+            )
+            end_time = time.perf_counter()
+            duration = end_time - start_time
+
+            # Reuse the API's count for the reply; hidden reasoning tokens are not part of it
+            token_hint = log_usage(self.name, usage)
+
+            if not stateless:
+                self._add_message("assistant", assistant_reply, token_hint=token_hint)
+            return assistant_reply, duration
+        except Exception as e:
+            # The client has already retried transient failures by this point
+            error_type = type(e).__name__
+            logging.error(f"Error in agent '{self.name}' reasoning: {error_type}: {e}")
 
-        return "An error occurred while generating a response.", time.time() - start_time
+        return "An error occurred while generating a response.", time.perf_counter() - start_time
 
     def _handle_chat_interaction(self, user_message):
         """
@@ -458,69 +843,42 @@ class Agent:
         Returns:
             tuple: (assistant_reply, duration)
         """
-        shared_system = get_shared_system_message()
-        system_message = f"{shared_system}\n\n{self.instructions}"
-
-        messages = [{"role": "user", "content": system_message}]
-        messages.extend(self.chat_history)
+        messages = [self.get_system_message_dict()]
+        messages.extend({"role": m["role"], "content": m["content"]} for m in self.chat_history)
         messages.append({"role": "user", "content": user_message})
 
-        start_time = time.time()
-        retries = 0
-        backoff = 1
-
-        while retries < RETRY_LIMIT:
-            try:
-                response = client.chat.completions.create(
-                    model="gpt-4o",  # Use of gpt-4o model for chat interaction
-                    messages=messages
-                )
-                end_time = time.time()
-                duration = end_time - start_time
-
-                assistant_reply = response.choices[0].message.content.strip()
-                self._add_message("assistant", assistant_reply, mode='chat')
-
-                usage = getattr(response, 'usage', None)
-                if usage:
-                    prompt_tokens = getattr(usage, 'prompt_tokens', 0)
-                    completion_tokens = getattr(usage, 'completion_tokens', 0)
-                    total_tokens = getattr(usage, 'total_tokens', 0)
-
-                    prompt_tokens_details = getattr(usage, 'prompt_tokens_details', None)
-                    if prompt_tokens_details:
-                        cached_tokens = getattr(prompt_tokens_details, 'cached_tokens', 0)
-                    else:
-                        cached_tokens = 0
-
-                    completion_tokens_details = getattr(usage, 'completion_tokens_details', None)
-                    if completion_tokens_details:
-                        reasoning_tokens = getattr(completion_tokens_details, 'reasoning_tokens', 0)
-                    else:
-                        reasoning_tokens = 0
-
-                    print(self.color + f"{self.name} used {cached_tokens} cached tokens out of {prompt_tokens} prompt tokens." + Style.RESET_ALL)
-                    print(self.color + f"{self.name} generated {completion_tokens} completion tokens, including {reasoning_tokens} reasoning tokens. Total tokens used: {total_tokens}." + Style.RESET_ALL)
-                else:
-                    print(self.color + f"{self.name} (No usage details returned.)" + Style.RESET_ALL)
-
-                return assistant_reply, duration
-            except Exception as e:
-                error_type = type(e).__name__
-                logging.error(f"Error in chat with agent '{self.name}': {error_type}: {e}")
-                retries += 1
-                if retries >= RETRY_LIMIT:
-                    logging.error(f"Agent '{self.name}' reached maximum retry limit in chat.")
-                    break
-                backoff_time = backoff * (RETRY_BACKOFF_FACTOR ** (retries - 1))
-                logging.info(f"Retrying chat in {backoff_time} seconds...")
-                time.sleep(backoff_time)
-
-        return "An error occurred while generating a response.", time.time() - start_time
+        start_time = time.perf_counter()
+        try:
+            # Stream the reply so it appears as soon as the first tokens arrive
+            cprint(self.color, f"{self.name}: ", end='')
+            assistant_reply, usage = stream_chat_completion(
+                model="gpt-4o",  # Use of gpt-4o model for chat interaction
+                messages=messages,
+                color=self.color
+            )
+            end_time = time.perf_counter()
+            duration = end_time - start_time
+
+            # Reuse the API's count for the reply; hidden reasoning tokens are not part of it
+            token_hint = log_usage(self.name, usage)
+
+            self._add_message("assistant", assistant_reply, mode='chat', token_hint=token_hint)
+            return assistant_reply, duration
+        except Exception as e:
+            # The client has already retried transient failures by this point
+            error_type = type(e).__name__
+            logging.error(f"Error in chat with agent '{self.name}': {error_type}: {e}")
+            # End the label or any partially streamed text, then show the error as the reply
+            print(Style.RESET_ALL if USE_COLOR else "")
+            error_message = "An error occurred while generating a response."
+            cprint(self.color, error_message)
+            return error_message, time.perf_counter() - start_time
 
     # =========================================================================
     # Public Actions
     # =========================================================================
+    # 'discuss' builds on the agent's history; 'verify', 'refine' and 'critique'
+    # act only on the text they are given, so they are sent without it.
 
     def discuss(self, prompt):
         """
@@ -544,8 +902,8 @@ class Agent:
         Returns:
             tuple: (verification_result, duration)
         """
-        verification_prompt = f"Verify the accuracy of the following information:\n\n{data}"
-        return self._handle_reasoning_logic(verification_prompt)
+        verification_prompt = f"{self.TASK_INSTRUCTIONS['verify']}\n\n{data}"
+        return self._handle_reasoning_logic(verification_prompt, stateless=True)
 
     def refine(self, data, more_time=False, iterations=2):
         """
@@ -554,24 +912,20 @@ class Agent:
         Args:
             data (str): The data to refine.
             more_time (bool): Whether to allow more time for refinement.
-            iterations (int): Number of refinement iterations.
+            iterations (int): Number of refinement passes requested in the prompt.
 
         Returns:
-            tuple: (refined_response, total_duration)
+            tuple: (refined_response, duration)
         """
-        refinement_prompt = f"Please refine the following response to improve its accuracy and completeness:\n\n{data}"
+        instruction = self.TASK_INSTRUCTIONS['refine']
         if more_time:
-            refinement_prompt += "\nTake additional time to improve the response thoroughly."
-
-        total_duration = 0
-        refined_response = data
-        for _ in range(iterations):
-            refined_response, duration = self._handle_reasoning_logic(refinement_prompt)
-            total_duration += duration
-            # For the next iteration, feed the previously refined response
-            refinement_prompt = f"Please further refine the following response:\n\n{refined_response}"
+            instruction += f"\n{self.TASK_INSTRUCTIONS['more_time']}"
+        if iterations > 1:
+            # The model runs the passes itself, so N rounds cost one round trip
+            instruction += f"\n{self.TASK_INSTRUCTIONS['passes'].format(iterations=iterations)}"
 
-        return refined_response, total_duration
+        refinement_prompt = f"{instruction}\n\n{data}"
+        return self._handle_reasoning_logic(refinement_prompt, stateless=True)
 
     def critique(self, other_agent_response):
         """
@@ -583,8 +937,8 @@ class Agent:
         Returns:
             tuple: (critique_result, duration)
         """
-        critique_prompt = f"Critique the following response for accuracy and completeness:\n\n{other_agent_response}"
-        return self._handle_reasoning_logic(critique_prompt)
+        critique_prompt = f"{self.TASK_INSTRUCTIONS['critique']}\n\n{other_agent_response}"
+        return self._handle_reasoning_logic(critique_prompt, stateless=True, model=CRITIQUE_MODEL)
 
     # =========================================================================
     # Minimal "Agent-to-Agent" Helper
@@ -601,7 +955,7 @@ class Agent:
         Returns:
             str: The other agent's response.
         """
-        print(f"\n{self.color}{self.name}{Style.RESET_ALL} asks {other_agent.color}{other_agent.name}{Style.RESET_ALL}: {question}")
+        print(f"\n{colorize(self.color, self.name)} asks {colorize(other_agent.color, other_agent.name)}: {question}")
         response, _ = other_agent.discuss(question)
         return response
 
@@ -622,7 +976,7 @@ def initialize_agents():
     agent_data_dict = {}
 
     if not agents_data:
-        print(Fore.YELLOW + "No agents found in the configuration. Using default agents." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, "No agents found in the configuration. Using default agents.")
         agent_a_data = {
             'name': 'Agent 47',
             'system_purpose': 'You are a logical and analytical assistant.',
@@ -637,7 +991,7 @@ def initialize_agents():
         agent_b = Agent(Fore.CYAN, **agent_b_data)
         agents = [agent_a, agent_b]
     else:
-        print(Fore.YELLOW + "Available agents:" + Style.RESET_ALL)
+        cprint(Fore.YELLOW, "Available agents:")
         agent_colors = {
             "Agent 47":     Fore.MAGENTA,
             "Agent 74":     Fore.CYAN,
@@ -646,36 +1000,19 @@ def initialize_agents():
         for agent_data in agents_data:
             name = agent_data.get('name', 'Unnamed Agent')
             color = agent_colors.get(name, Fore.WHITE)
-            print(color + f"- {name}" + Style.RESET_ALL)
+            cprint(color, f"- {name}")
 
             agent = Agent(color, **agent_data)
             agents.append(agent)
             agent_data_dict[name] = agent_data
 
-        # Inform agents about the other agents
+        # Inform agents about the other agents. Each description is built once
+        # and then joined for every agent that should know about it.
+        descriptions = {agent.name: describe_agent(agent_data_dict[agent.name]) for agent in agents}
         for agent in agents:
-            other_agents_info = ""
-            for other_agent in agents:
-                if other_agent.name != agent.name:
-                    info = f"Name: {other_agent.name}"
-                    other_agent_data = agent_data_dict[other_agent.name]
-                    system_purpose = other_agent_data.get('system_purpose', '')
-                    info += f"\nSystem Purpose: {system_purpose}"
-                    other_attributes = {
-                        k: v
-                        for k, v in other_agent_data.items()
-                        if k not in ['name', 'system_purpose']
-                    }
-                    for attr_name, attr_value in other_attributes.items():
-                        if isinstance(attr_value, dict):
-                            details = "\n".join(
-                                f"{ak.replace('_', ' ').title()}: {av}"
-                                for ak, av in attr_value.items()
-                            )
-                            info += f"\n{attr_name.replace('_',' ').title()}:\n{details}"
-                        else:
-                            info += f"\n{attr_name.replace('_',' ').title()}: {attr_value}"
-                    other_agents_info += f"\n\n{info}"
+            other_agents_info = "\n\n".join(
+                [descriptions[other_agent.name] for other_agent in agents if other_agent.name != agent.name]
+            )
             agent.instructions += f"\n\nYou are aware of the following other agents:\n{other_agents_info.strip()}"
 
     return agents
@@ -686,7 +1023,8 @@ def initialize_agents():
 
 def blend_responses(agent_responses, user_prompt):
     """
-    Combines multiple agent responses into a single, optimal response.
+    Combines multiple agent responses into a single, optimal response, streaming
+    the blended text to the console as it is generated.
 
     Args:
         agent_responses (list of tuples): List containing (agent_name, response) pairs.
@@ -695,68 +1033,62 @@ def blend_responses(agent_responses, user_prompt):
     Returns:
         str: The blended optimal response.
     """
+    responses_text = "\n\n".join(
+        [f"Response from {agent_name}:\n{response}" for agent_name, response in agent_responses]
+    )
     combined_prompt = (
         "Please combine the following responses into a single, optimal answer to the question.\n"
         f"Question: '{user_prompt}'\n"
-        "Responses:\n"
-        + "\n\n".join(f"Response from {agent_name}:\n{response}" for agent_name, response in agent_responses)
-        + "\n\nProvide a concise and accurate combined response."
+        f"Responses:\n{responses_text}\n\n"
+        "Provide a concise and accurate combined response."
     )
 
     try:
-        response = client.chat.completions.create(
-            model="o1-2024-12-17",  # Adjust your model name here
-            messages=[{"role": "user", "content": combined_prompt}]
+        blended_reply, usage = stream_chat_completion(
+            model=REASONING_MODEL,
+            messages=[{"role": "user", "content": combined_prompt}],
+            color=Fore.GREEN
         )
 
-        blended_reply = response.choices[0].message.content.strip()
-
-        usage = getattr(response, 'usage', None)
-        if usage:
-            prompt_tokens = getattr(usage, 'prompt_tokens', 0)
-            completion_tokens = getattr(usage, 'completion_tokens', 0)
-            total_tokens = getattr(usage, 'total_tokens', 0)
-
-            prompt_tokens_details = getattr(usage, 'prompt_tokens_details', None)
-            if prompt_tokens_details:
-                cached_tokens = getattr(prompt_tokens_details, 'cached_tokens', 0)
-            else:
-                cached_tokens = 0
-
-            completion_tokens_details = getattr(usage, 'completion_tokens_details', None)
-            if completion_tokens_details:
-                reasoning_tokens = getattr(completion_tokens_details, 'reasoning_tokens', 0)
-            else:
-                reasoning_tokens = 0
-
-            print(Fore.GREEN + f"Blending used {cached_tokens} cached tokens out of {prompt_tokens} prompt tokens." + Style.RESET_ALL)
-            print(Fore.GREEN + f"Blending generated {completion_tokens} completion tokens, including {reasoning_tokens} reasoning tokens. Total tokens used: {total_tokens}." + Style.RESET_ALL)
-        else:
-            print(Fore.GREEN + "(No usage details returned for blending.)" + Style.RESET_ALL)
+        log_usage("Blending", usage)
 
         return blended_reply
     except Exception as e:
         logging.error(f"Error in blending responses: {e}")
-        return "An error occurred while attempting to blend responses."
+        error_message = "An error occurred while attempting to blend responses."
+        cprint(Fore.GREEN, error_message)
+        return error_message
 
 # =============================================================================
 # Console Utilities
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def render_divider(char, length, color):
+    """
+    Builds (once per combination) the colored divider string.
+    """
+    return colorize(color, char * length)
+
+@lru_cache(maxsize=None)
+def render_header(title, color):
+    """
+    Builds (once per title and color) the boxed header string.
+    """
+    border = "═" * 58
+    return colorize(color, f"╔{border}╗\n║{title.center(58)}║\n╚{border}╝")
+
 def print_divider(char="═", length=100, color=Fore.YELLOW):
     """
     Prints a divider line of specified character, length, and color.
     """
-    print(color + (char * length) + Style.RESET_ALL)
+    sys.stdout.write(render_divider(char, length, color) + "\n")
 
 def print_header(title, color=Fore.YELLOW):
     """
     Prints a formatted header with a box around the title text.
     """
-    border = "═" * 58
-    print(color + f"╔{border}╗")
-    print(color + f"║{title.center(58)}║")
-    print(color + f"╚{border}╝" + Style.RESET_ALL)
+    sys.stdout.write(render_header(title, color) + "\n")
 
 def process_agent_action(agent, action, *args, **kwargs):
     """
@@ -771,56 +1103,145 @@ def process_agent_action(agent, action, *args, **kwargs):
     Returns:
         tuple: (result_text, duration)
     """
-    action_method = getattr(agent, action, None)
+    action_method = agent._dispatch.get(action)
     if not action_method:
         logging.error(f"Action '{action}' not found for agent '{agent.name}'.")
         return "Invalid action.", 0
 
     action_description = agent.ACTION_DESCRIPTIONS.get(action, "performing an action")
 
-    print_divider()
-    print(Fore.YELLOW + f"System Message: {agent.color}{agent.name} is {action_description}..." + Style.RESET_ALL)
+    # Each block goes out in a single write so concurrent agents don't interleave lines
+    sys.stdout.write(
+        f"{render_divider('═', 100, Fore.YELLOW)}\n"
+        f"{colorize(Fore.YELLOW, 'System Message: ')}{colorize(agent.color, f'{agent.name} is {action_description}...')}\n"
+    )
 
     try:
         result, duration = action_method(*args, **kwargs)
+        output = ""
         if result:
-            print(agent.color + f"\n=== {agent.name} {action.capitalize()} Output ===" + Style.RESET_ALL)
-            print(agent.color + result + Style.RESET_ALL)
-        print(agent.color + f"{agent.name}'s action completed in {duration:.2f} seconds." + Style.RESET_ALL)
+            output += colorize(agent.color, f"\n=== {agent.name} {action.capitalize()} Output ===") + "\n"
+            output += colorize(agent.color, result) + "\n"
+        output += colorize(agent.color, f"{agent.name}'s action completed in {duration:.2f} seconds.") + "\n"
+        sys.stdout.write(output)
+        sys.stdout.flush()
         return result, duration
     except Exception as e:
         logging.error(f"Error during {action} action for {agent.name}: {e}")
         return "An error occurred.", 0
 
-def handle_special_commands(user_input, agents):
+def run_parallel(action, agent_args, **kwargs):
+    """
+    Runs the same action for several agents concurrently on the shared executor.
+
+    Args:
+        action (str): The action to perform.
+        agent_args (list of tuples): (agent, argument) pairs; each agent acts on its own argument.
+        **kwargs: Keyword arguments passed to every action call.
+
+    Returns:
+        tuple: (results, durations) dictionaries keyed by agent name.
+    """
+    futures = {
+        EXECUTOR.submit(process_agent_action, agent, action, arg, **kwargs): agent
+        for agent, arg in agent_args
+    }
+    results = {}
+    durations = {}
+    for future in as_completed(futures):
+        agent = futures[future]
+        results[agent.name], durations[agent.name] = future.result()
+    return results, durations
+
+def review_args(action, agents, opinions):
+    """
+    Selects the agents whose responses are worth sending for review. Trivially short
+    responses and refusals are passed through as they are, saving a round trip each.
+
+    Args:
+        action (str): The review action ('verify' or 'refine').
+        agents (list): List of Agent instances.
+        opinions (dict): Each agent's response, keyed by agent name.
+
+    Returns:
+        tuple: (agent_args, passed_through) where agent_args is a list of
+            (agent, response) pairs for run_parallel and passed_through maps the
+            skipped agents' names to their unchanged responses.
+    """
+    agent_args = []
+    passed_through = {}
+    for agent in agents:
+        opinion = opinions[agent.name]
+        if estimate_tokens(opinion) < REVIEW_MIN_TOKENS or opinion.startswith(REFUSAL_PREFIXES):
+            cprint(agent.color, f"{agent.name}'s response is too short or a refusal; skipping {action}.")
+            passed_through[agent.name] = opinion
+        else:
+            agent_args.append((agent, opinion))
+    return agent_args, passed_through
+
+def command_exit(agents):
+    """
+    Handles the 'exit' command by ending the program.
+
+    Args:
+        agents (list): List of Agent instances (unused).
+    """
+    cprint(Fore.YELLOW, "Goodbye!")
+    sys.exit(0)
+
+def command_history(agents):
+    """
+    Handles the 'history' command by printing each agent's conversation.
+
+    Args:
+        agents (list): List of Agent instances.
+
+    Returns:
+        bool: Always True.
+    """
+    # Buffer the whole dump and emit it with a single write
+    lines = [colorize(Fore.YELLOW, "\nConversation History:")]
+    for agent in agents:
+        lines.append(colorize(agent.color, f"\n{agent.name} Conversation:"))
+        lines.extend(f"{msg['role'].capitalize()}: {msg['content']}" for msg in agent.messages)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return True
+
+def command_clear(agents):
+    """
+    Handles the 'clear' command by resetting every agent's history.
+
+    Args:
+        agents (list): List of Agent instances.
+
+    Returns:
+        bool: Always True.
+    """
+    for agent in agents:
+        agent.clear_history()
+    cprint(Fore.YELLOW, "Conversation history cleared.")
+    return True
+
+SPECIAL_COMMANDS = {
+    'exit':    command_exit,
+    'history': command_history,
+    'clear':   command_clear,
+}
+
+def handle_special_commands(command, agents):
     """
     Handles special user commands: 'exit', 'history', 'clear'.
 
     Args:
-        user_input (str): The user's input command.
+        command (str): The user's input, already stripped and lowercased.
         agents (list): List of Agent instances.
 
     Returns:
         bool: True if a special command was handled, False otherwise.
     """
-    cmd = user_input.strip().lower()
-    if cmd == 'exit':
-        print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
-        sys.exit(0)
-    elif cmd == 'history':
-        print(Fore.YELLOW + "\nConversation History:" + Style.RESET_ALL)
-        for agent in agents:
-            print(agent.color + f"\n{agent.name} Conversation:" + Style.RESET_ALL)
-            for msg in agent.messages:
-                print(f"{msg['role'].capitalize()}: {msg['content']}")
-        return True
-    elif cmd == 'clear':
-        for agent in agents:
-            agent.messages.clear()
-            agent.chat_history.clear()
-        print(Fore.YELLOW + "Conversation history cleared." + Style.RESET_ALL)
-        return True
-    return False
+    handler = SPECIAL_COMMANDS.get(command)
+    return handler(agents) if handler else False
 
 # =============================================================================
 # Chat Logic (with local memory retrieval)
@@ -834,49 +1255,46 @@ def chat_with_agents(agents):
         agents (list): List of Agent instances.
     """
     while True:
-        print(Fore.YELLOW + "Available agents to chat with:" + Style.RESET_ALL)
+        cprint(Fore.YELLOW, "Available agents to chat with:")
         for idx, agent in enumerate(agents, 1):
-            print(f"{idx}. {agent.color}{agent.name}{Style.RESET_ALL}")
+            print(f"{idx}. {colorize(agent.color, agent.name)}")
 
-        print(Fore.YELLOW + "Enter the number of the agent to chat with, or 'menu' to return, or 'exit' to exit program: " + Style.RESET_ALL, end='')
+        cprint(Fore.YELLOW, "Enter the number of the agent to chat with, or 'menu' to return, or 'exit' to exit program: ", end='')
         selection = input().strip().lower()
 
         if selection == 'menu':
             return
         if selection == 'exit':
-            print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Goodbye!")
             sys.exit(0)
 
         if selection.isdigit() and 1 <= int(selection) <= len(agents):
             selected_agent = agents[int(selection) - 1]
         else:
-            print(Fore.YELLOW + f"Invalid selection. Please enter a number between 1 and {len(agents)}, 'menu', or 'exit'." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, f"Invalid selection. Please enter a number between 1 and {len(agents)}, 'menu', or 'exit'.")
             continue
 
-        print(Fore.YELLOW + f"Starting chat with {selected_agent.color}{selected_agent.name}{Style.RESET_ALL}.")
-        print(Fore.YELLOW + "Type 'menu' to return to agent selection or 'exit' to end the program." + Style.RESET_ALL)
+        print(f"{colorize(Fore.YELLOW, 'Starting chat with ')}{colorize(selected_agent.color, selected_agent.name)}.")
+        cprint(Fore.YELLOW, "Type 'menu' to return to agent selection or 'exit' to end the program.")
 
         while True:
-            print(Fore.YELLOW + "\nYou (type 'menu' or 'exit'): " + Style.RESET_ALL, end='')
+            cprint(Fore.YELLOW, "\nYou (type 'menu' or 'exit'): ", end='')
             user_message = input().strip()
+            command = user_message.lower()
 
-            if user_message.lower() == 'menu':
-                print(Fore.YELLOW + "Returning to agent selection menu..." + Style.RESET_ALL)
+            if command == 'menu':
+                cprint(Fore.YELLOW, "Returning to agent selection menu...")
                 break
-            if user_message.lower() == 'exit':
-                print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
-                sys.exit(0)
 
-            # Retrieve local context from reasoning_history.json
+            # Handle special commands (including 'exit')
+            if handle_special_commands(command, [selected_agent]):
+                continue
+
+            # Retrieve local context from reasoning_history.jsonl
             local_context = get_local_context_for_prompt(user_message, is_swarm=False)
             user_message_with_context = f"{user_message}\n\n{local_context}" if local_context else user_message
 
-            # Handle special commands
-            if handle_special_commands(user_message, [selected_agent]):
-                continue
-
-            assistant_reply, duration = selected_agent._handle_chat_interaction(user_message_with_context)
-            print(selected_agent.color + f"{selected_agent.name}: {assistant_reply}" + Style.RESET_ALL)
+            selected_agent._handle_chat_interaction(user_message_with_context)
 
 # =============================================================================
 # Reasoning Logic (with local memory + agent-to-agent help)
@@ -891,22 +1309,20 @@ def reasoning_logic(agents):
         agents (list): A list of Agent instances.
     """
     while True:
-        print(Fore.YELLOW + "Please enter your prompt (or type 'menu' to return, 'exit' to quit): " + Style.RESET_ALL, end='')
+        cprint(Fore.YELLOW, "Please enter your prompt (or type 'menu' to return, 'exit' to quit): ", end='')
         user_prompt = input().strip()
+        command = user_prompt.lower()
 
-        if user_prompt.lower() == 'menu':
-            print(Fore.YELLOW + "Returning to main menu." + Style.RESET_ALL)
+        if command == 'menu':
+            cprint(Fore.YELLOW, "Returning to main menu.")
             break
-        if user_prompt.lower() == 'exit':
-            print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
-            sys.exit(0)
 
-        # Handle special commands
-        if handle_special_commands(user_prompt, agents):
+        # Handle special commands (including 'exit')
+        if handle_special_commands(command, agents):
             continue
 
         if len(user_prompt) <= 4:
-            print(Fore.YELLOW + "Your prompt must be more than 4 characters. Please try again." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Your prompt must be more than 4 characters. Please try again.")
             continue
 
         # Retrieve local memory relevant to user_prompt
@@ -917,160 +1333,153 @@ def reasoning_logic(agents):
 
         # ============ Step 1: Discuss ============
         print_header("Reasoning Step 1: Discussing the Prompt")
-        opinions = {}
-        durations = {}
-        for agent in agents:
-            # Example: Agent can ask another agent for help based on specific keyword
-            if "ask-other" in extended_prompt.lower() and len(agents) > 1:
-                helper_agent = agents[(agents.index(agent) + 1) % len(agents)]
-                help_response = agent.ask_other_agent(helper_agent, "Do you have any insights on this topic?")
-                full_opinion_prompt = f"{extended_prompt}\nHelper agent says: {help_response}"
-            else:
-                full_opinion_prompt = extended_prompt
-
-            opinion, duration = process_agent_action(agent, 'discuss', full_opinion_prompt)
-            opinions[agent.name] = opinion
-            durations[agent.name] = duration
+        discussion_prompts = {agent.name: extended_prompt for agent in agents}
+        # Example: Agent can ask another agent for help based on specific keyword.
+        # Each agent helps exactly one other agent, so the help requests run concurrently.
+        if "ask-other" in extended_prompt.lower() and len(agents) > 1:
+            help_futures = {
+                EXECUTOR.submit(
+                    agent.ask_other_agent,
+                    agents[(i + 1) % len(agents)],
+                    "Do you have any insights on this topic?"
+                ): agent
+                for i, agent in enumerate(agents)
+            }
+            for future in as_completed(help_futures):
+                agent = help_futures[future]
+                discussion_prompts[agent.name] = f"{extended_prompt}\nHelper agent says: {future.result()}"
+
+        opinions, durations = run_parallel(
+            'discuss', [(agent, discussion_prompts[agent.name]) for agent in agents]
+        )
 
         total_discussion_time = sum(durations.values())
         print_divider()
-        print(Fore.YELLOW + f"Total discussion time: {total_discussion_time:.2f} seconds." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Total discussion time: {total_discussion_time:.2f} seconds.")
 
         # ============ Step 2: Verify ============
         print_header("Reasoning Step 2: Verifying Responses")
-        verified_opinions = {}
-        verify_durations = {}
-
-        with ThreadPoolExecutor() as executor:
-            futures = {executor.submit(process_agent_action, agent, 'verify', opinions[agent.name]): agent for agent in agents}
-            for future in futures:
-                agent = futures[future]
-                verified_opinion, duration = future.result()
-                verified_opinions[agent.name] = verified_opinion
-                verify_durations[agent.name] = duration
+        verify_args, verified_opinions = review_args('verify', agents, opinions)
+        verified, verify_durations = run_parallel('verify', verify_args)
+        verified_opinions.update(verified)
+        # Passed-through agents took no time, but every agent needs an entry
+        verify_durations = {**dict.fromkeys(verified_opinions, 0.0), **verify_durations}
 
         total_verification_time = sum(verify_durations.values())
         print_divider()
-        print(Fore.YELLOW + f"Total verification time: {total_verification_time:.2f} seconds." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Total verification time: {total_verification_time:.2f} seconds.")
 
         # ============ Step 3: Critique ============
         print_header("Reasoning Step 3: Critiquing Responses")
-        critiques = {}
-        critique_durations = {}
         num_agents = len(agents)
-        for i, agent in enumerate(agents):
-            other_agent = agents[(i + 1) % num_agents]
-            critique, duration = process_agent_action(agent, 'critique', verified_opinions[other_agent.name])
-            critiques[agent.name] = critique
-            critique_durations[agent.name] = duration
+        critiques, critique_durations = run_parallel(
+            'critique',
+            [(agent, verified_opinions[agents[(i + 1) % num_agents].name]) for i, agent in enumerate(agents)]
+        )
 
         total_critique_time = sum(critique_durations.values())
         print_divider()
-        print(Fore.YELLOW + f"Total critique time: {total_critique_time:.2f} seconds." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Total critique time: {total_critique_time:.2f} seconds.")
 
         # ============ Step 4: Refine ============
         print_header("Reasoning Step 4: Refining Responses")
-        refined_opinions = {}
-        refine_durations = {}
-        for agent in agents:
-            refined_opinion, duration = process_agent_action(agent, 'refine', opinions[agent.name])
-            refined_opinions[agent.name] = refined_opinion
-            refine_durations[agent.name] = duration
+        refine_args, refined_opinions = review_args('refine', agents, opinions)
+        refined, refine_durations = run_parallel('refine', refine_args)
+        refined_opinions.update(refined)
+        # The feedback loop adds to every agent's duration, including passed-through ones
+        refine_durations = {**dict.fromkeys(refined_opinions, 0.0), **refine_durations}
 
         total_refinement_time = sum(refine_durations.values())
         print_divider()
-        print(Fore.YELLOW + f"Total refinement time: {total_refinement_time:.2f} seconds." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Total refinement time: {total_refinement_time:.2f} seconds.")
 
         # ============ Step 5: Blend ============
         print_header("Reasoning Step 5: Blending Responses")
         agent_responses = [(agent.name, refined_opinions[agent.name]) for agent in agents]
-        start_blend_time = time.time()
+        print_divider()
+        print_header("Optimal Response")
+        start_blend_time = time.perf_counter()
         optimal_response = blend_responses(agent_responses, user_prompt)
-        end_blend_time = time.time()
+        end_blend_time = time.perf_counter()
         blend_duration = end_blend_time - start_blend_time
 
         print_divider()
-        print_header("Optimal Response")
-        print(Fore.GREEN + optimal_response + Style.RESET_ALL)
-        print_divider()
-        print(Fore.YELLOW + f"Response generated in {blend_duration:.2f} seconds." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, f"Response generated in {blend_duration:.2f} seconds.")
 
         # ======= Feedback Loop ========
         refine_count = 0
         more_time = False
         user_feedback = None
         while refine_count < MAX_REFINEMENT_ATTEMPTS:
-            print(Fore.YELLOW + "\nWas this response helpful and accurate? (yes/no, 'menu' to main menu, 'exit' to quit): " + Style.RESET_ALL, end='')
+            cprint(Fore.YELLOW, "\nWas this response helpful and accurate? (yes/no, 'menu' to main menu, 'exit' to quit): ", end='')
             user_feedback = input().strip().lower()
 
             if user_feedback == 'menu':
-                print(Fore.YELLOW + "Returning to main menu." + Style.RESET_ALL)
+                cprint(Fore.YELLOW, "Returning to main menu.")
                 save_reasoning_session(user_prompt, optimal_response, user_feedback, context_retained=False)
                 return
             if user_feedback == 'exit':
-                print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
+                cprint(Fore.YELLOW, "Goodbye!")
                 save_reasoning_session(user_prompt, optimal_response, user_feedback, context_retained=False)
                 sys.exit(0)
 
             if user_feedback == 'yes':
-                print(Fore.YELLOW + "Thank you for your feedback!" + Style.RESET_ALL)
+                cprint(Fore.YELLOW, "Thank you for your feedback!")
                 break
             elif user_feedback != 'no':
-                print(Fore.YELLOW + "Please answer 'yes', 'no', 'menu' or 'exit'." + Style.RESET_ALL)
+                cprint(Fore.YELLOW, "Please answer 'yes', 'no', 'menu' or 'exit'.")
                 continue
 
             # If user says no, attempt to refine again
             refine_count += 1
             if refine_count >= 2:
-                print(Fore.YELLOW + "Would you like the agents to take more time refining the response? (yes/no): " + Style.RESET_ALL, end='')
+                cprint(Fore.YELLOW, "Would you like the agents to take more time refining the response? (yes/no): ", end='')
                 more_time_input = input().strip().lower()
                 more_time = (more_time_input == 'yes')
 
-            print(Fore.YELLOW + "We're sorry to hear that. Let's try to improve the response." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "We're sorry to hear that. Let's try to improve the response.")
 
+            refined_opinions, feedback_durations = run_parallel(
+                'refine',
+                [(agent, refined_opinions[agent.name]) for agent in agents],
+                more_time=more_time
+            )
             for agent in agents:
-                refined_opinion, duration = process_agent_action(
-                    agent, 'refine',
-                    refined_opinions[agent.name],
-                    more_time=more_time
-                )
-                refined_opinions[agent.name] = refined_opinion
-                refine_durations[agent.name] += duration
+                refine_durations[agent.name] += feedback_durations[agent.name]
 
             total_refinement_time = sum(refine_durations.values())
             print_divider()
-            print(Fore.YELLOW + f"Total refinement time: {total_refinement_time:.2f} seconds." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, f"Total refinement time: {total_refinement_time:.2f} seconds.")
 
             # Re-blend the refined responses
             print_divider()
             print_header("Blending Refined Responses")
             agent_responses = [(agent.name, refined_opinions[agent.name]) for agent in agents]
-            start_blend_time = time.time()
+            print_divider()
+            print_header("New Optimal Response")
+            start_blend_time = time.perf_counter()
             optimal_response = blend_responses(agent_responses, user_prompt)
-            end_blend_time = time.time()
+            end_blend_time = time.perf_counter()
             blend_duration = end_blend_time - start_blend_time
 
             print_divider()
-            print_header("New Optimal Response")
-            print(Fore.GREEN + optimal_response + Style.RESET_ALL)
-            print_divider()
-            print(Fore.YELLOW + f"Response generated in {blend_duration:.2f} seconds." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, f"Response generated in {blend_duration:.2f} seconds.")
 
         else:
-            print(Fore.YELLOW + "Maximum refinement attempts reached." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Maximum refinement attempts reached.")
 
         if not user_feedback:
             user_feedback = "no"
 
-        print(Fore.YELLOW + "Would you like to retain this conversation context for the next prompt? (yes/no): " + Style.RESET_ALL, end='')
+        cprint(Fore.YELLOW, "Would you like to retain this conversation context for the next prompt? (yes/no): ", end='')
         retain_context_input = input().strip().lower()
         context_retained = (retain_context_input == 'yes')
         if not context_retained:
             for agent in agents:
-                agent.messages.clear()
-            print(Fore.YELLOW + "Conversation context has been reset." + Style.RESET_ALL)
+                agent.clear_history('reasoning')
+            cprint(Fore.YELLOW, "Conversation context has been reset.")
         else:
-            print(Fore.YELLOW + "Conversation context has been retained for the next prompt." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Conversation context has been retained for the next prompt.")
 
         # Save final session
         save_reasoning_session(user_prompt, optimal_response, user_feedback, context_retained)
@@ -1097,7 +1506,7 @@ def save_reasoning_session(user_prompt, final_response, user_feedback, context_r
         "context_retained": context_retained
     }
     append_reasoning_history(record)
-    logging.info("Reasoning session appended to reasoning_history.json.")
+    logging.info("Reasoning session appended to reasoning_history.jsonl.")
 
 # =============================================================================
 # Swarm Reasoning Feedback (with local memory as well)
@@ -1113,34 +1522,34 @@ def swarm_reasoning_feedback(user_prompt, final_response):
     """
     user_feedback = None
     while True:
-        print(Fore.YELLOW + "\nWas this response helpful and accurate? (yes/no, 'menu' to main menu, 'exit' to quit): " + Style.RESET_ALL, end='')
+        cprint(Fore.YELLOW, "\nWas this response helpful and accurate? (yes/no, 'menu' to main menu, 'exit' to quit): ", end='')
         user_feedback = input().strip().lower()
 
         if user_feedback == 'menu':
-            print(Fore.YELLOW + "Returning to main menu." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Returning to main menu.")
             save_swarm_session(user_prompt, final_response, user_feedback, context_retained=False)
             return
         elif user_feedback == 'exit':
-            print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Goodbye!")
             save_swarm_session(user_prompt, final_response, user_feedback, context_retained=False)
             sys.exit(0)
         elif user_feedback == 'yes':
-            print(Fore.YELLOW + "Thank you for your feedback!" + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Thank you for your feedback!")
             break
         elif user_feedback != 'no':
-            print(Fore.YELLOW + "Please answer 'yes', 'no', 'menu' or 'exit'." + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Please answer 'yes', 'no', 'menu' or 'exit'.")
             continue
         else:
-            print(Fore.YELLOW + "Sorry to hear that. (Swarm refining is not yet implemented.)" + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Sorry to hear that. (Swarm refining is not yet implemented.)")
             break
 
-    print(Fore.YELLOW + "Would you like to retain this conversation context for the next prompt? (yes/no): " + Style.RESET_ALL, end='')
+    cprint(Fore.YELLOW, "Would you like to retain this conversation context for the next prompt? (yes/no): ", end='')
     retain_context_input = input().strip().lower()
     context_retained = (retain_context_input == 'yes')
     if not context_retained:
-        print(Fore.YELLOW + "Swarm conversation context has been reset." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, "Swarm conversation context has been reset.")
     else:
-        print(Fore.YELLOW + "Swarm conversation context has been retained for the next prompt." + Style.RESET_ALL)
+        cprint(Fore.YELLOW, "Swarm conversation context has been retained for the next prompt.")
 
     # Save swarm session
     save_swarm_session(user_prompt, final_response, user_feedback, context_retained)
@@ -1163,7 +1572,7 @@ def save_swarm_session(user_prompt, final_response, user_feedback, context_retai
         "context_retained": context_retained
     }
     append_swarm_history(record)
-    logging.info("Swarm-based session appended to swarm_reasoning_history.json.")
+    logging.info("Swarm-based session appended to swarm_reasoning_history.jsonl.")
 
 # =============================================================================
 # Main Menu
@@ -1181,6 +1590,8 @@ def main_menu():
     or 'exit' (to end the program).
     """
     agents = initialize_agents()
+    migrate_legacy_history(REASONING_HISTORY_FILE)
+    migrate_legacy_history(SWARM_HISTORY_FILE)
     current_mode = None
 
     while True:
@@ -1188,19 +1599,19 @@ def main_menu():
         if current_mode is None:
             print_divider()
             print_header("Multi-Agent Reasoning Chatbot")
-            print(Fore.YELLOW + "Please select an option:" + Style.RESET_ALL)
+            cprint(Fore.YELLOW, "Please select an option:")
             print("1. Chat with an agent")
             print("2. Use reasoning logic")
             print("3. Use Swarm-based reasoning")
             print("4. Exit")
 
             while True:
-                print(Fore.YELLOW + "Enter your choice (1/2/3/4): " + Style.RESET_ALL, end='')
+                cprint(Fore.YELLOW, "Enter your choice (1/2/3/4): ", end='')
                 choice = input().strip()
                 if choice in ['1', '2', '3', '4']:
                     break
                 else:
-                    print(Fore.YELLOW + "Invalid choice. Please enter 1, 2, 3, or 4." + Style.RESET_ALL)
+                    cprint(Fore.YELLOW, "Invalid choice. Please enter 1, 2, 3, or 4.")
 
             if choice == '1':
                 current_mode = 'chat'
@@ -1209,7 +1620,7 @@ def main_menu():
             elif choice == '3':
                 current_mode = 'swarm'
             elif choice == '4':
-                print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
+                cprint(Fore.YELLOW, "Goodbye!")
                 sys.exit(0)
 
         # ----------------------------------------------------------------------
@@ -1235,14 +1646,14 @@ def main_menu():
         elif current_mode == 'swarm':
             # We stay in swarm-based mode until user selects 'menu' or 'exit'.
             while True:
-                print(Fore.YELLOW + 
-                      "Enter your reasoning prompt for Swarm (or type 'menu' to return, 'exit' to quit): " +
-                      Style.RESET_ALL, end='')
+                cprint(Fore.YELLOW,
+                       "Enter your reasoning prompt for Swarm (or type 'menu' to return, 'exit' to quit): ",
+                       end='')
                 user_prompt = input().strip()
                 lower_prompt = user_prompt.lower()
 
                 if lower_prompt == 'exit':
-                    print(Fore.YELLOW + "Goodbye!" + Style.RESET_ALL)
+                    cprint(Fore.YELLOW, "Goodbye!")
                     sys.exit(0)
                 elif lower_prompt == 'menu':
                     current_mode = None
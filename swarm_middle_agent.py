@@ -2,12 +2,42 @@ import os
 import sys
 import time
 import logging
+import logging.handlers
+import queue
+import atexit
 import json
+from functools import lru_cache
 from colorama import Fore, Style, init
 from swarm import Agent, Swarm  # Ensure the 'swarm' package is installed
 
-# Initialize colorama
-init(autoreset=True)
+# Initialize colorama. Color codes are only emitted when stdout is a terminal, so
+# redirected output carries no escape sequences for colorama to strip.
+USE_COLOR = sys.stdout.isatty()
+init(autoreset=True, strip=not USE_COLOR)
+
+def colorize(color, text):
+    """
+    Wraps text in the given color when stdout is a terminal.
+
+    Args:
+        color (str): The color code from colorama.
+        text (str): The text to color.
+
+    Returns:
+        str: The colored text, or the text unchanged when color is disabled.
+    """
+    return f"{color}{text}{Style.RESET_ALL}" if USE_COLOR else text
+
+def cprint(color, message, **kwargs):
+    """
+    Prints a message in the given color, or plainly when stdout is not a terminal.
+
+    Args:
+        color (str): The color code from colorama.
+        message (str): The message to print.
+        **kwargs: Passed through to print (e.g. end='').
+    """
+    print(colorize(color, message), **kwargs)
 
 # =============================================================================
 # Logging Configuration
@@ -55,10 +85,22 @@ file_handler.setLevel(logging.INFO)
 file_formatter = logging.Formatter('%(asctime)s %(levelname)s:%(message)s')
 file_handler.setFormatter(file_formatter)
 
-# Configure the root logger to use both handlers
+# Both handlers run on a background listener thread, so threads making API calls
+# only enqueue records instead of blocking on console and file writes
+log_queue = queue.Queue(-1)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+# Pass only the message through the queue; the listener's handlers add the prefix
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = logging.handlers.QueueListener(
+    log_queue, console_handler, file_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Configure the root logger to use the queue handler
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[console_handler, file_handler],
+    handlers=[queue_handler],
 )
 
 # =============================================================================
@@ -88,9 +130,11 @@ client = initialize_swarm_client()
 
 AGENTS_CONFIG_FILE = 'agents.json'
 
+@lru_cache(maxsize=1)
 def load_agents_config():
     """
-    Loads agent configurations from the 'agents.json' file.
+    Loads agent configurations from the 'agents.json' file. The file is parsed once
+    per process; call 'load_agents_config.cache_clear()' to pick up edits.
 
     Returns:
         list: A list of agent configurations.
@@ -111,6 +155,36 @@ def load_agents_config():
 # Utility Functions
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def render_divider(char, length, color):
+    """
+    Builds (once per combination) the colored divider string.
+
+    Args:
+        char (str): The character to use for the divider.
+        length (int): The length of the divider.
+        color (str): The color code from colorama.
+
+    Returns:
+        str: The divider string.
+    """
+    return colorize(color, char * length)
+
+@lru_cache(maxsize=None)
+def render_header(title, color):
+    """
+    Builds (once per title and color) the boxed header string.
+
+    Args:
+        title (str): The header title.
+        color (str): The color code from colorama.
+
+    Returns:
+        str: The header string.
+    """
+    border = "═" * 58
+    return "\n" + colorize(color, f"╔{border}╗\n║{title.center(58)}║\n╚{border}╝")
+
 def print_divider(char="═", length=100, color=Fore.YELLOW):
     """
     Prints a divider line of specified character, length, and color.
@@ -120,7 +194,7 @@ def print_divider(char="═", length=100, color=Fore.YELLOW):
         length (int): The length of the divider.
         color (str): The color code from colorama.
     """
-    print(color + (char * length) + Style.RESET_ALL)
+    print(render_divider(char, length, color))
 
 def print_header(title, color=Fore.YELLOW):
     """
@@ -130,15 +204,37 @@ def print_header(title, color=Fore.YELLOW):
         title (str): The header title.
         color (str): The color code from colorama.
     """
-    border = "═" * 58
-    print(color + f"\n╔{border}╗")
-    print(color + f"║{title.center(58)}║")
-    print(color + f"╚{border}╝" + Style.RESET_ALL)
+    print(render_header(title, color))
 
 # =============================================================================
 # Swarm Agents Initialization
 # =============================================================================
 
+def describe_agent(agent_data):
+    """
+    Builds the description of an agent that is shared with the other agents.
+
+    Args:
+        agent_data (dict): The agent's configuration.
+
+    Returns:
+        str: The agent's name, system purpose and remaining attributes.
+    """
+    lines = [
+        f"Name: {agent_data.get('name', 'Unnamed Agent')}",
+        f"System Purpose: {agent_data.get('system_purpose', '')}",
+    ]
+    for attr_name, attr_value in agent_data.items():
+        if attr_name in ['name', 'system_purpose']:
+            continue
+        title = attr_name.replace('_', ' ').title()
+        if isinstance(attr_value, dict):
+            lines.append(f"{title}:")
+            lines.extend(f"{ak.replace('_', ' ').title()}: {av}" for ak, av in attr_value.items())
+        else:
+            lines.append(f"{title}: {attr_value}")
+    return "\n".join(lines)
+
 def initialize_swarm_agents():
     """
     Initializes Swarm-based agents from configuration.
@@ -180,30 +276,13 @@ def initialize_swarm_agents():
         agents.append(swarm_agent)
         agent_data_dict[name] = agent_data
 
-    # Inform agents about other agents
+    # Inform agents about other agents. Each description is built once
+    # and then joined for every agent that should know about it.
+    descriptions = {agent.name: describe_agent(agent_data_dict[agent.name]) for agent in agents}
     for agent in agents:
-        other_agents_info = ""
-        for other_agent in agents:
-            if other_agent.name != agent.name:
-                info = f"Name: {other_agent.name}"
-                o_data = agent_data_dict[other_agent.name]
-                sp = o_data.get('system_purpose', '')
-                info += f"\nSystem Purpose: {sp}"
-
-                more_attrs = {
-                    k: v for k, v in o_data.items()
-                    if k not in ['name', 'system_purpose']
-                }
-                for attr_name, attr_value in more_attrs.items():
-                    if isinstance(attr_value, dict):
-                        details = "\n".join(
-                            f"{ak.replace('_',' ').title()}: {av}" for ak, av in attr_value.items()
-                        )
-                        info += f"\n{attr_name.replace('_',' ').title()}:\n{details}"
-                    else:
-                        info += f"\n{attr_name.replace('_',' ').title()}: {attr_value}"
-                other_agents_info += f"\n\n{info}"
-
+        other_agents_info = "\n\n".join(
+            [descriptions[other_agent.name] for other_agent in agents if other_agent.name != agent.name]
+        )
         agent.instructions += (
             f"\n\nYou are aware of the following other agents:\n{other_agents_info.strip()}"
         )
@@ -233,7 +312,7 @@ def run_swarm_reasoning(user_prompt):
     critiques = {}
     refined_opinions = {}
 
-    print(Fore.YELLOW + "\nRunning Swarm-based reasoning...\n" + Style.RESET_ALL)
+    cprint(Fore.YELLOW, "\nRunning Swarm-based reasoning...\n")
 
     # ------------------ Step 1: Discuss the Prompt ------------------
     print_header("Reasoning Step 1: Discussing the Prompt")
@@ -245,7 +324,7 @@ def run_swarm_reasoning(user_prompt):
         agent_opinion = response.messages[-1]['content']
         opinions[agent.name] = agent_opinion
         color = get_agent_color(agent.name)
-        print(color + f"{agent.name} response: {agent_opinion}" + Style.RESET_ALL)
+        cprint(color, f"{agent.name} response: {agent_opinion}")
 
     # ------------------ Step 2: Verify the Responses ------------------
     print_header("Reasoning Step 2: Verifying Responses")
@@ -260,7 +339,7 @@ def run_swarm_reasoning(user_prompt):
         verified_opinion = response.messages[-1]['content']
         verified_opinions[agent.name] = verified_opinion
         color = get_agent_color(agent.name)
-        print(color + f"{agent.name} verified response: {verified_opinion}" + Style.RESET_ALL)
+        cprint(color, f"{agent.name} verified response: {verified_opinion}")
 
     # ------------------ Step 3: Critique Each Other ------------------
     print_header("Reasoning Step 3: Critiquing Responses")
@@ -277,7 +356,7 @@ def run_swarm_reasoning(user_prompt):
         critique_text = response.messages[-1]['content']
         critiques[agent.name] = critique_text
         color = get_agent_color(agent.name)
-        print(color + f"{agent.name} critique on {other_agent.name}:\n{critique_text}\n" + Style.RESET_ALL)
+        cprint(color, f"{agent.name} critique on {other_agent.name}:\n{critique_text}\n")
 
     # ------------------ Step 4: Refine the Responses ------------------
     print_header("Reasoning Step 4: Refining Responses")
@@ -295,14 +374,14 @@ def run_swarm_reasoning(user_prompt):
         refined_text = response.messages[-1]['content']
         refined_opinions[agent.name] = refined_text
         color = get_agent_color(agent.name)
-        print(color + f"{agent.name} refined response: {refined_text}" + Style.RESET_ALL)
+        cprint(color, f"{agent.name} refined response: {refined_text}")
 
     # ------------------ Step 5: Blend Refined Responses ------------------
     print_header("Reasoning Step 5: Blending Responses")
     agent_responses = [(agent.name, refined_opinions[agent.name]) for agent in agents]
     final_blended_response = blend_responses(agent_responses, user_prompt)
-    print(Fore.GREEN + f"\nFinal Blended Response:\n{final_blended_response}" + Style.RESET_ALL)
-    print(Fore.GREEN + "\nSwarm-based reasoning completed.\n" + Style.RESET_ALL)
+    cprint(Fore.GREEN, f"\nFinal Blended Response:\n{final_blended_response}")
+    cprint(Fore.GREEN, "\nSwarm-based reasoning completed.\n")
 
     return final_blended_response
 
@@ -317,14 +396,14 @@ def blend_responses(agent_responses, user_prompt):
     Returns:
         str: The blended optimal response text.
     """
+    responses_text = "\n\n".join(
+        [f"Response from {agent_name}:\n{response}" for agent_name, response in agent_responses]
+    )
     combined_prompt = (
         "Please combine the following responses into a single, optimal answer to the question.\n"
         f"Question: '{user_prompt}'\n"
-        "Responses:\n"
-        + "\n\n".join(
-            f"Response from {agent_name}:\n{response}" for agent_name, response in agent_responses
-        )
-        + "\n\nProvide a concise and accurate combined response."
+        f"Responses:\n{responses_text}\n\n"
+        "Provide a concise and accurate combined response."
     )
 
     try:
@@ -406,9 +485,9 @@ def swarm_middle_agent_interface(user_prompt):
         str: The final swarm response or None if an error occurred.
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         final_text = run_swarm_reasoning(user_prompt)
-        end_time = time.time()
+        end_time = time.perf_counter()
         logging.info(f"Swarm reasoning completed in {end_time - start_time:.2f} seconds.")
         return final_text
     except Exception as e:
@@ -423,6 +502,6 @@ if __name__ == "__main__":
     test_prompt = "What is love and how does it affect human behavior?"
     final = swarm_middle_agent_interface(test_prompt)
     if final:
-        print(Fore.CYAN + f"\nSwarm final answer:\n{final}\n" + Style.RESET_ALL)
+        cprint(Fore.CYAN, f"\nSwarm final answer:\n{final}\n")
     else:
-        print(Fore.CYAN + "No final swarm response captured." + Style.RESET_ALL)
+        cprint(Fore.CYAN, "No final swarm response captured.")